@@ -18,12 +18,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
+from hypercube.arrays import ArrayRecord
 from hypercube.base_cube import HyperCube
 from hypercube.dims import Dimension
 
 from hypercube.array_factory import (
     create_local_arrays,
+    create_local_aligned_numpy_arrays_on_cube,
+    create_local_mapped_numpy_arrays_on_cube,
     create_local_numpy_arrays_on_cube,
+    create_local_pagelocked_numpy_arrays_on_cube,
+    create_local_pooled_numpy_arrays_on_cube,
     create_local_pycuda_arrays_on_cube)
 
 from hypercube.version import __version__
@@ -18,42 +18,69 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
-from weakref import WeakKeyDictionary
-
 import functools
 
 import numpy as np
 
-class ArrayDescriptor(object):
-    """ Descriptor class for arrays """
-    def __init__(self, name):
-        self.data = WeakKeyDictionary()
-        self.name = name
-
-    def __get__(self, instance, owner):
-        return self.data[instance]
+def aligned_factory(shape, dtype, alignment=64):
+    """
+    Creates numpy arrays whose data starts on an alignment byte
+    boundary (a cache line by default), carved out of a
+    slightly larger uint8 buffer
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape))*dtype.itemsize
+    buf = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -buf.ctypes.data % alignment
+    return buf[offset:offset+nbytes].view(dtype).reshape(shape)
 
-    def __set__(self, instance, value):
-        self.data[instance] = value
+def gpuarray_factory(shape, dtype, allocator=None):
+    """
+    Creates pycuda gpuarrays. If supplied, device memory is obtained
+    from allocator, for example the allocate method of a caller owned
+    pycuda.tools.DeviceMemoryPool, amortising cuMemAlloc over
+    repeated allocations. Otherwise pycuda's default allocation is used.
 
-    def __delete__(self, instance):
-        del self.data[instance]
+    .. code-block:: python
 
-def gpuarray_factory(shape, dtype):
+        pool = pycuda.tools.DeviceMemoryPool()
+        create_local_pycuda_arrays_on_cube(cube,
+            array_factory=functools.partial(gpuarray_factory,
+                allocator=pool.allocate))
+    """
     import pycuda.gpuarray as gpuarray
-    return gpuarray.empty(shape=shape, dtype=dtype)
+
+    if allocator is None:
+        return gpuarray.empty(shape=shape, dtype=dtype)
+
+    return gpuarray.empty(shape=shape, dtype=dtype, allocator=allocator)
+
+def pagelocked_factory(shape, dtype, mapped=False):
+    """
+    Creates page-locked numpy arrays, which allow asynchronous
+    host to device copies via pycuda.driver.memcpy_htod_async.
+    If mapped is True, the memory is also mapped into the device
+    address space and ary.base.get_device_pointer() gives a
+    pointer that kernels can access without an explicit copy.
+    Mapping requires that the current context was created with
+    the MAP_HOST flag, for example via
+    cuda.Device(0).make_context(cuda.ctx_flags.MAP_HOST),
+    otherwise get_device_pointer() fails
+    """
+    import pycuda.driver as cuda
+
+    mem_flags = cuda.host_alloc_flags.DEVICEMAP if mapped else 0
+
+    return cuda.pagelocked_empty(shape=shape, dtype=dtype,
+        mem_flags=mem_flags)
 
 def generic_stitch(cube, arrays):
     """
-    Creates descriptors associated with array name and
-    then sets the array as a member variable
+    Sets each array as a member variable of the cube,
+    storing it directly in the cube's instance dictionary
     """
-    
-    for name, ary in arrays.items():
-        if name not in type(cube).__dict__:
-            setattr(type(cube), name, ArrayDescriptor(name))
 
-        setattr(cube, name, ary)
+    vars(cube).update(arrays)
 
 def create_local_arrays(reified_arrays, array_factory=None):
     """
@@ -89,7 +116,46 @@ def create_local_arrays(reified_arrays, array_factory=None):
     # array_factory for each array
     return { n: array_factory(ra.shape, ra.dtype)
         for n, ra in reified_arrays.items() }
-    
+
+def create_local_pooled_arrays(reified_arrays, alignment=64):
+    """
+    Function that creates numpy arrays, given the definitions in
+    the reified_arrays dictionary, as views of a single buffer.
+    One allocation therefore serves every array, each of
+    which starts on an alignment byte boundary.
+    The buffer is only freed once all the arrays are released.
+
+    Arguments
+    ---------
+        reified_arrays : dictionary
+            Dictionary keyed on array name and array definitions.
+            Can be obtained via cube.arrays(reify=True)
+
+    Keyword Arguments
+    -----------------
+        alignment : int
+            Byte alignment of each array within the buffer
+
+    Returns
+    -------
+    A dictionary of array objects, keyed on array names
+    """
+
+    # Lay the arrays out one after the other,
+    # padding each up to the alignment
+    layout, nbytes = [], 0
+
+    for n, ra in reified_arrays.items():
+        dtype = np.dtype(ra.dtype)
+        size = int(np.prod(ra.shape))*dtype.itemsize
+        layout.append((n, ra.shape, dtype, nbytes, size))
+        nbytes += -(-size // alignment)*alignment
+
+    buf = aligned_factory((nbytes,), np.uint8, alignment)
+
+    return { n: buf[o:o+size].view(dtype).reshape(shape)
+        for n, shape, dtype, o, size in layout }
+
 def create_local_arrays_on_cube(cube, reified_arrays=None, array_stitch=None, array_factory=None):
     """
     Function that creates arrays on the supplied hypercube, given the supplied
@@ -110,8 +176,8 @@ def create_local_arrays_on_cube(cube, reified_arrays=None, array_stitch=None, ar
             It's signature should be array_stitch(cube, arrays)
             where cube is a HyperCube object and arrays is a
             dictionary containing array objects keyed by their name.
-            If None, a default function will be used that creates
-            python descriptors associated with the individual array objects.
+            If None, a default function will be used that sets
+            the individual array objects as members of the cube.
         array_factory : function
             A function that creates array objects. It's signature should
             be array_factory(shape, dtype) and should return a constructed
@@ -137,12 +203,64 @@ def create_local_arrays_on_cube(cube, reified_arrays=None, array_stitch=None, ar
 
     return arrays    
 
+def create_local_pooled_numpy_arrays_on_cube(cube, reified_arrays=None, array_stitch=None):
+    """
+    Function that creates numpy arrays on the supplied hypercube,
+    carved out of a single buffer by create_local_pooled_arrays.
+
+    Arguments
+    ---------
+        cube : HyperCube
+            A hypercube object on which arrays will be created.
+
+    Keyword Arguments
+    -----------------
+        reified_arrays : dictionary
+            Dictionary keyed on array name and array definitions.
+            If None, obtained from cube.arrays(reify=True)
+        array_stitch : function
+            A function that stitches array objects onto the cube object.
+            If None, generic_stitch is used.
+
+    Returns
+    -------
+    A dictionary of array objects, keyed on array names
+    """
+
+    if array_stitch is None:
+        array_stitch = generic_stitch
+
+    if reified_arrays is None:
+        reified_arrays = cube.arrays(reify=True)
+
+    arrays = create_local_pooled_arrays(reified_arrays)
+    array_stitch(cube, arrays)
+
+    return arrays
+
 create_local_numpy_arrays_on_cube = functools.partial(
     create_local_arrays_on_cube,
     array_stitch=generic_stitch,
     array_factory=np.empty)
 
+create_local_aligned_numpy_arrays_on_cube = functools.partial(
+    create_local_arrays_on_cube,
+    array_stitch=generic_stitch,
+    array_factory=aligned_factory)
+
+# The current context must have been created with
+# pycuda.driver.ctx_flags.MAP_HOST, see pagelocked_factory
+create_local_mapped_numpy_arrays_on_cube = functools.partial(
+    create_local_arrays_on_cube,
+    array_stitch=generic_stitch,
+    array_factory=functools.partial(pagelocked_factory, mapped=True))
+
 create_local_pycuda_arrays_on_cube = functools.partial(
     create_local_arrays_on_cube,
     array_stitch=generic_stitch,
-    array_factory=gpuarray_factory)
\ No newline at end of file
+    array_factory=gpuarray_factory)
+
+create_local_pagelocked_numpy_arrays_on_cube = functools.partial(
+    create_local_arrays_on_cube,
+    array_stitch=generic_stitch,
+    array_factory=pagelocked_factory)
\ No newline at end of file
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2016 SKA South Africa
+#
+# This file is part of hypercube.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+import collections.abc
+import types
+
+class ArrayRecord(collections.abc.Mapping):
+    """
+    The ArrayRecord class describes an array registered on a hypercube.
+
+    Fields are available as attributes or as mapping keys,
+    so that a record can be passed on as keyword arguments
+    to :meth:`~hypercube.base_cube.HyperCube.register_array`.
+
+    Records are read-only, as hypercubes cache information
+    derived from them. Use :meth:`copy` to change fields.
+    """
+    __slots__ = ['name', 'dtype', 'shape', 'extra', '_sort_key']
+
+    _FIELDS = ('name', 'dtype', 'shape')
+
+    def __init__(self, name, dtype, shape, **kwargs):
+        """
+        Create an ArrayRecord from supplied arguments
+
+        :param name: Array name
+        :type name: str
+        :param dtype: Array data type
+        :param shape: Array shape schema, containing Dimension names or ints
+        :type shape: tuple
+        :param kwargs: Any additional array information
+
+        """
+        _set = object.__setattr__
+        _set(self, 'name', name)
+        # Case-insensitive key for sorting arrays by name
+        _set(self, '_sort_key', name.upper())
+        _set(self, 'dtype', dtype)
+        _set(self, 'shape', shape)
+        _set(self, 'extra', types.MappingProxyType(kwargs) if kwargs else None)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Array record fields are read-only, "
+            "use copy() to change '{k}'".format(k=key))
+
+    def __delattr__(self, key):
+        raise AttributeError("Array record fields are read-only, "
+            "'{k}' cannot be deleted".format(k=key))
+
+    def __reduce__(self):
+        # Reconstruct from the fields, as
+        # the slots can't be assigned to
+        return (_array_record, (dict(self),))
+
+    def copy(self, **kwargs):
+        """
+        Returns
+        -------
+            A copy of the array record, with any
+            fields in kwargs replaced
+        """
+        fields = dict(self)
+        fields.update(kwargs)
+        return ArrayRecord(**fields)
+
+    def __getattr__(self, key):
+        # Only called for names that aren't slots,
+        # so look in the additional array information
+        try:
+            return object.__getattribute__(self, 'extra')[key]
+        except (AttributeError, KeyError, TypeError):
+            raise AttributeError("Array record has no attribute '{k}'"
+                .format(k=key))
+
+    def __getitem__(self, key):
+        if key in ArrayRecord._FIELDS:
+            return getattr(self, key)
+
+        if self.extra is None:
+            raise KeyError(key)
+
+        return self.extra[key]
+
+    def __iter__(self):
+        for key in ArrayRecord._FIELDS:
+            yield key
+
+        if self.extra is not None:
+            for key in self.extra:
+                yield key
+
+    def __len__(self):
+        return len(ArrayRecord._FIELDS) + (0 if self.extra is None
+            else len(self.extra))
+
+    def __repr__(self):
+        return "ArrayRecord({d})".format(d=dict(self))
+
+def _array_record(fields):
+    """ Creates an ArrayRecord from a dictionary of fields, for unpickling """
+    return ArrayRecord(**fields)
@@ -23,48 +23,63 @@ import collections.abc
 
 
 import itertools
+import operator
+import re
 import sys
 import types
-from weakref import WeakKeyDictionary
 
 import numpy as np
-import attridict as AttrDict
 from tabulate import tabulate
 
+from hypercube.arrays import ArrayRecord
 from hypercube.dims import create_dimension, Dimension
 import hypercube.util as hcu
 
-class PropertyDescriptor(object):
-    """ Descriptor class for properties """
-    def __init__(self, record_key, default=None, ):
-        self.default = default
-        self.record_key = record_key
-        self.data = WeakKeyDictionary()
-
-    def __get__(self, instance, owner):
-        return self.data.get(instance,self.default)
-
-    def __set__(self, instance, value):
-        dtype = instance._properties[self.record_key].dtype
-        self.data[instance] = dtype(value)
-
-    def __delete__(self, instance):
-        del self.data[instance]
+# Separators accepted between dimension names in a single string
+_DIM_SEPARATORS = re.compile(',|:|;| ')
 
 class HyperCube(object):
     """ Hypercube. """
 
+    # __dict__ holds generated setters and stitched arrays,
+    # __weakref__ keeps cubes weakly referenceable
+    __slots__ = ['_property_values', '_property_casts',
+        '_dims', '_arrays', '_properties',
+        '_dim_version', '_array_version',
+        '_reified_arrays_cache', '_reified_arrays_version',
+        '_dim_maps', '_dim_maps_version', '_default_setters',
+        '_str_cache', '__dict__', '__weakref__']
+
     def __init__(self, *args, **kwargs):
         """
         Hypercube Constructor
         """
 
+        # Property values and the scalar types used to cast them,
+        # keyed on property name. Assigned first as __setattr__
+        # consults them
+        object.__setattr__(self, '_property_values', {})
+        object.__setattr__(self, '_property_casts', {})
+
         # Dictionaries to store records about our
         # dimensions, arrays and properties
         self._dims = collections.OrderedDict()
         self._arrays = collections.OrderedDict()
         self._properties = collections.OrderedDict()
 
+        # Bumped whenever dimensions or arrays change,
+        # invalidating the reified array cache
+        self._dim_version = 0
+        self._array_version = 0
+        self._reified_arrays_cache = {}
+        self._reified_arrays_version = None
+        self._dim_maps = None
+        self._dim_maps_version = None
+        self._str_cache = (None, None)
+
+        # Default property setters, created on first access
+        self._default_setters = {}
+
         # Register any dimensions, arrays and
         # properties we're provided
         dims = kwargs.get('dimensions', None)
@@ -89,8 +104,8 @@ class HyperCube(object):
             Estimated number of bytes required by arrays registered
             on the cube, taking their extents into account.
         """
-        return np.sum([hcu.array_bytes(a) for a
-            in self.arrays(reify=True).values()])
+        return sum(hcu.array_bytes(self._reified_array_view(n))
+            for n in self._arrays)
 
     def mem_required(self):
         """
@@ -139,18 +154,32 @@ class HyperCube(object):
 
         """
 
-        if name in self._dims:
+        name, D = self._create_dimension((), name, dim_data, **kwargs)
+        self._dims[name] = D
+        self._dim_version += 1
+
+        return D
+
+    def _create_dimension(self, pending, name, dim_data, **kwargs):
+        """
+        Creates a dimension about to be registered,
+        complaining if its name is already registered on
+        this cube or present in the pending registrations.
+        Returns the interned name and the dimension.
+        """
+
+        # Interned keys let dictionary lookups
+        # with literal names compare by identity
+        name = sys.intern(name)
+
+        if name in self._dims or name in pending:
             raise AttributeError((
                 "Attempted to register dimension '{n}'' "
                 "as an attribute of the cube, but "
                 "it already exists. Please choose "
                 "a different name!").format(n=name))
 
-        # Create the dimension dictionary
-        D = self._dims[name] = create_dimension(name,
-            dim_data, **kwargs)
-
-        return D
+        return name, create_dimension(name, dim_data, **kwargs)
 
     def register_dimensions(self, dims):
         """
@@ -165,19 +194,53 @@ class HyperCube(object):
                 'lower_extent' : 2, 'upper_extent' : 7 },
             ])
 
+        or, keyed on dimension name
+
+        .. code-block:: python
+
+            cube.register_dimensions({
+                'ntime' : 10,
+                'na' : {'global_size' : 3, 'lower_extent' : 1 },
+            })
+
+        Every dimension is created before any is registered,
+        so a duplicate name leaves the cube unchanged.
 
         Parameters
         ----------
         dims : list or dict
-            A list or dictionary of dimensions
+            A list or dictionary of dimensions, dimension
+            dictionaries or, if keyed on name, global sizes
 
         """
 
         if isinstance(dims, collections.abc.Mapping):
-            dims = iter(dims.values())
+            specs = dims.items()
+        else:
+            specs = ((None, dim) for dim in dims)
 
-        for dim in dims:
-            self.register_dimension(dim.name, dim)
+        records = collections.OrderedDict()
+
+        for name, spec in specs:
+            kwargs = {}
+
+            if isinstance(spec, Dimension):
+                name = spec.name
+            elif isinstance(spec, collections.abc.Mapping):
+                kwargs = dict(spec)
+                name = kwargs.pop('name', name)
+
+                try:
+                    spec = kwargs.pop('global_size')
+                except KeyError:
+                    raise ValueError("No global_size was specified "
+                        "for dimension '{n}'".format(n=name)) from None
+
+            name, D = self._create_dimension(records, name, spec, **kwargs)
+            records[name] = D
+
+        self._dims.update(records)
+        self._dim_version += 1
 
     def update_dimensions(self, dims):
         """
@@ -192,6 +255,15 @@ class HyperCube(object):
                 'lower_extent' : 2, 'upper_extent' : 7 },
             ])
 
+        or, keyed on dimension name
+
+        .. code-block:: python
+
+            cube.update_dimensions({
+                'ntime' : {'lower_extent' : 2, 'upper_extent' : 7 },
+                'na' : {'lower_extent' : 1, 'upper_extent' : 3 },
+            })
+
         Parameters
         ----------
         dims : list or dict:
@@ -199,7 +271,10 @@ class HyperCube(object):
         """
 
         if isinstance(dims, collections.abc.Mapping):
-            dims = iter(dims.values())
+            # Dimension updates in a dictionary are named by their key
+            dims = (dict(dim, name=name) if isinstance(dim, dict)
+                and 'name' not in dim else dim
+                for name, dim in dims.items())
 
         for dim in dims:
             # Defer to update dimension for dictionaries
@@ -208,6 +283,7 @@ class HyperCube(object):
             # Replace if given a Dimension object
             elif isinstance(dim, Dimension):
                 self._dims[dim.name] = dim
+                self._dim_version += 1
             else:
                 raise TypeError("Unhandled type '{t}'"
                     "in update_dimensions".format(t=type(dim)))
@@ -238,6 +314,15 @@ class HyperCube(object):
                     .format(n=name))
 
         dim.update(**update_dict)
+        self._dim_version += 1
+
+    def _dims_state(self):
+        """
+        Returns a key identifying the current dimension state,
+        covering both changes made through the cube and
+        updates made directly to Dimension objects
+        """
+        return (self._dim_version, Dimension._mutations)
 
     def _dim_attribute(self, attr, *args, **kwargs):
         """
@@ -255,32 +340,76 @@ class HyperCube(object):
             ntime, nbl, nchan, nsrc = cube._dim_attribute('global_size', 'ntime,nbl:nchan nsrc')
         """
 
-        import re
+        # If we got a single string argument, try splitting it by separators,
+        # unless it's a plain name which can't contain any
+        if (len(args) == 1 and isinstance(args[0], str)
+                and not args[0].isidentifier()):
+            args = [s.strip() for s in _DIM_SEPARATORS.split(args[0])]
 
-        # If we got a single string argument, try splitting it by separators
-        if len(args) == 1 and isinstance(args[0], str):
-            args = (s.strip() for s in re.split(',|:|;| ', args[0]))
+        attr_map = self._dim_map(attr)
 
-        # Now get the specific attribute for each string dimension
-        # Integers are returned as is
-        result = [d if isinstance(d, (int, np.integer))
-            else getattr(self._dims[d], attr) for d in args]
+        # Look up several dimension names in a single itemgetter call
+        if len(args) > 1 and all(type(d) is str for d in args):
+            result = list(operator.itemgetter(*args)(attr_map))
+        # Otherwise get the specific attribute for each string dimension
+        # Integers are returned as is. Check for the common
+        # str case first, avoiding the np.integer ABC check
+        else:
+            result = [attr_map[d] if type(d) is str
+                else d if isinstance(d, (int, np.integer))
+                else attr_map[d] for d in args]
 
         # Return single element if length one and single else entire list
         return (result[0] if kwargs.get('single', True)
             and len(result) == 1 else result)
 
+    def _rebuild_dim_maps(self):
+        """
+        Builds mappings of dimension name to global size,
+        lower extent, upper extent and extents in a single pass
+        over the registered dimensions
+        """
+        global_size, lower_extent, upper_extent, extents = {}, {}, {}, {}
+
+        for n, d in self._dims.items():
+            global_size[n] = d.global_size
+            lower_extent[n] = d.lower_extent
+            upper_extent[n] = d.upper_extent
+            extents[n] = d.extents
+
+        self._dim_maps = {
+            'global_size': global_size,
+            'lower_extent': lower_extent,
+            'upper_extent': upper_extent,
+            'extents': extents }
+        self._dim_maps_version = self._dims_state()
+
+    def _dim_map(self, attr):
+        """
+        Returns a mapping of dimension name to dimension attribute attr,
+        rebuilding the mappings if dimensions have changed.
+        The returned mapping must not be modified.
+        """
+        if self._dim_maps_version != self._dims_state():
+            self._rebuild_dim_maps()
+
+        return self._dim_maps[attr]
+
     def dim_global_size_dict(self):
-        """ Returns a mapping of dimension name to global size """
-        return { d.name: d.global_size for d in self._dims.values()}
+        """ Returns a read-only mapping of dimension name to global size """
+        return types.MappingProxyType(self._dim_map('global_size'))
 
     def dim_lower_extent_dict(self):
-        """ Returns a mapping of dimension name to lower_extent """
-        return { d.name: d.lower_extent for d in self._dims.values()}
+        """ Returns a read-only mapping of dimension name to lower_extent """
+        return types.MappingProxyType(self._dim_map('lower_extent'))
 
     def dim_upper_extent_dict(self):
-        """ Returns a mapping of dimension name to upper_extent """
-        return { d.name: d.upper_extent for d in self._dims.values()}
+        """ Returns a read-only mapping of dimension name to upper_extent """
+        return types.MappingProxyType(self._dim_map('upper_extent'))
+
+    def dim_extents_dict(self):
+        """ Returns a read-only mapping of dimension name to (lower_extent, upper_extent) """
+        return types.MappingProxyType(self._dim_map('extents'))
 
     def dim_global_size(self, *args, **kwargs):
         """
@@ -316,7 +445,8 @@ class HyperCube(object):
         """
 
         # The lower extent of any integral dimension is 0 by default
-        args = tuple(0 if isinstance(a, (int, np.integer))
+        args = tuple(a if type(a) is str
+            else 0 if isinstance(a, (int, np.integer))
             else a for a in args)
         return self._dim_attribute('lower_extent', *args, **kwargs)
 
@@ -404,17 +534,27 @@ class HyperCube(object):
             Array data type
         """
 
+        A = self._arrays[name] = self._create_array_record(
+            (), name, shape, dtype, **kwargs)
+        self._array_version += 1
+
+        return A
+
+    def _create_array_record(self, pending, name, shape, dtype, **kwargs):
+        """
+        Creates a record for an array about to be registered,
+        complaining if its name is already registered on
+        this cube or present in the pending registrations
+        """
+        name = sys.intern(name)
+
         # Complain if array exists
-        if name in self._arrays:
+        if name in self._arrays or name in pending:
             raise ValueError(('Array %s is already registered '
                 'on this cube object.') % name)
 
         # OK, create a record for this array
-        A = self._arrays[name] = AttrDict(name=name,
-            dtype=dtype, shape=shape,
-            **kwargs)
-
-        return A
+        return ArrayRecord(name=name, dtype=dtype, shape=shape, **kwargs)
 
     def register_arrays(self, arrays):
         """
@@ -434,10 +574,18 @@ class HyperCube(object):
         """
 
         if isinstance(arrays, collections.abc.Mapping):
-            arrays = iter(arrays.values())
+            arrays = arrays.values()
+
+        # Create every record before registering any of them,
+        # so that a duplicate name leaves the cube unchanged
+        records = collections.OrderedDict()
 
         for ary in arrays:
-            self.register_array(**ary)
+            A = self._create_array_record(records, **ary)
+            records[A.name] = A
+
+        self._arrays.update(records)
+        self._array_version += 1
 
     def register_property(self, name, dtype, default, **kwargs):
         """
@@ -461,44 +609,78 @@ class HyperCube(object):
             raise ValueError(('Property %s is already registered '
                 'on this cube object.') % name)
 
-        P = self._properties[name] = AttrDict(name=name,
+        P = self._properties[name] = hcu.attr_dict(name=name,
             dtype=dtype, default=default)
 
-        #if not hasattr(HyperCube, name):
-        if name not in HyperCube.__dict__:
-                # Create the descriptor for this property on the class instance
-            setattr(HyperCube, name, PropertyDescriptor(record_key=name, default=default))
-
-        # Set the descriptor on this object instance
+        # Cache the scalar type used to cast values
+        # and set the default value of this property
+        self._property_casts[name] = np.dtype(dtype).type
         setattr(self, name, default)
 
         # Should we create a setter for this property?
         setter = kwargs.get('setter_method', True)
         setter_name = hcu.setter_name(name)
 
-        # Yes, create a default setter
-        if isinstance(setter, bool) and setter is True:
-            def set(self, value):
-                setattr(self,name,value)
-
-            setter_method = types.MethodType(set, self)
-            setattr(self, setter_name, setter_method)
-
-            # Set up the docstring, using the supplied one
-            # if it is present, otherwise generating a default
-            setter_docstring = kwargs.get('setter_docstring', None)
-            getattr(setter_method, '__func__').__doc__ = \
-                """ Sets property %s to value. """ % (name) \
-                if setter_docstring is None else setter_docstring
-
+        # Yes, create a default setter when first accessed
+        if setter is True:
+            self._default_setters[setter_name] = (name,
+                kwargs.get('setter_docstring', None))
+        # No setter
+        elif setter is False:
+            pass
         elif isinstance(setter, types.MethodType):
             setattr(self, setter_name, setter)
         else:
-            raise TypeError('setter keyword argument set',
-                ' to an invalid type %s' % (type(setter)))
+            raise TypeError('setter_method keyword argument set '
+                'to an invalid type %s' % (type(setter)))
 
         return P
 
+    def __getattr__(self, attr):
+        """
+        Returns property values and creates default
+        property setters on first access
+        """
+        try:
+            return object.__getattribute__(self, '_property_values')[attr]
+        except (AttributeError, KeyError):
+            pass
+
+        try:
+            default_setters = object.__getattribute__(self, '_default_setters')
+            name, setter_docstring = default_setters.pop(attr)
+        except (AttributeError, KeyError):
+            raise AttributeError("'{c}' object has no attribute '{a}'"
+                .format(c=type(self).__name__, a=attr))
+
+        def set(self, value):
+            setattr(self,name,value)
+
+        # Set up the docstring, using the supplied one
+        # if it is present, otherwise generating a default
+        set.__doc__ = """ Sets property %s to value. """ % (name) \
+            if setter_docstring is None else setter_docstring
+
+        setter_method = set.__get__(self, type(self))
+        setattr(self, attr, setter_method)
+
+        return setter_method
+
+    def __setattr__(self, attr, value):
+        """ Casts values assigned to properties to the property type """
+        # Property casts aren't yet set while copying
+        try:
+            casts = object.__getattribute__(self, '_property_casts')
+        except AttributeError:
+            casts = ()
+
+        # Test membership, rather than catching a KeyError
+        # on every non-property assignment
+        if attr in casts:
+            self._property_values[attr] = casts[attr](value)
+        else:
+            object.__setattr__(self, attr, value)
+
     def register_properties(self, properties):
         """
         Register properties using a list defining the properties.
@@ -520,7 +702,7 @@ class HyperCube(object):
 
         """
         if isinstance(properties, collections.abc.Mapping):
-            properties = iter(properties.values())
+            properties = properties.values()
 
         for prop in properties:
             self.register_property(**prop)
@@ -563,11 +745,34 @@ class HyperCube(object):
         -------
         dict
             A dictionary of array dictionaries, keyed
-            on array name
+            on array name. Unless reified, this is a
+            read-only view of the registered arrays.
 
         """
-        return (self._arrays if not reify else
-            hcu.reify_arrays(self._arrays, self.dimensions(copy=False)))
+        if not reify:
+            return types.MappingProxyType(self._arrays)
+
+        return { n: a.copy(shape=self._reified_array_view(n).shape)
+            for n, a in self._arrays.items() }
+
+    def _reified_array_view(self, name):
+        """
+        Returns a read-only view of the named reified array,
+        recomputing it only if dimensions or arrays
+        have changed since it was last requested.
+        """
+        version = (self._dims_state(), self._array_version)
+
+        if self._reified_arrays_version != version:
+            self._reified_arrays_cache = {}
+            self._reified_arrays_version = version
+
+        try:
+            return self._reified_arrays_cache[name]
+        except KeyError:
+            view = self._reified_arrays_cache[name] = hcu.reify_arrays(
+                { name: self._arrays[name] }, self._dims, copy='shallow')[name]
+            return view
 
     def array(self, name, reify=False):
         """
@@ -596,13 +801,16 @@ class HyperCube(object):
         """
 
         try:
-            return (self._arrays[name] if not reify else
-                hcu.reify_arrays({name : self._arrays[name]},
-                    self.dimensions(copy=False))[name])
+            A = self._arrays[name]
         except KeyError:
             raise KeyError("Array '{n}' is not registered on this cube"
                 .format(n=name))
 
+        if not reify:
+            return A
+
+        return A.copy(shape=self._reified_array_view(name).shape)
+
     def dimensions(self, copy=True):
         """
         Return a dictionary of :class:`~hypercube.dims.Dimension` objects.
@@ -610,7 +818,8 @@ class HyperCube(object):
         Parameters
         ----------
         copy : boolean:
-            Returns a copy of the dimension dictionary if True (Default value = True)
+            Returns a copy of the dimension dictionary if True,
+            otherwise a read-only view of it (Default value = True)
 
         Returns
         -------
@@ -619,7 +828,7 @@ class HyperCube(object):
 
         """
 
-        return self._dims.copy() if copy else self._dims
+        return self._dims.copy() if copy else types.MappingProxyType(self._dims)
 
     def dimension(self, name, copy=True):
         """
@@ -660,8 +869,8 @@ class HyperCube(object):
             'Global Size', 'Extents']
 
         table = []
-        for dimval in sorted(iter(self.dimensions(copy=False).values()),
-                             key=lambda dval: dval.name.upper()):
+        for dimval in sorted(self._dims.values(),
+                             key=operator.attrgetter('_sort_key')):
 
             table.append([dimval.name,
                 dimval.description,
@@ -677,19 +886,17 @@ class HyperCube(object):
         """
         headers = ['Array Name', 'Size', 'Type', 'Shape']
 
-        # Reify arrays to work out their actual size
-        reified_arrays = self.arrays(reify=True)
-
         table = []
-        for array in sorted(iter(self.arrays().values()),
-                             key=lambda aval: aval.name.upper()):
-            # Get the actual size of the array
-            nbytes = hcu.array_bytes(reified_arrays[array.name])
+        for array in sorted(self._arrays.values(),
+                             key=operator.attrgetter('_sort_key')):
+            # Get the actual size of the reified array
+            reified = self._reified_array_view(array.name)
+            nbytes = hcu.array_bytes(reified)
             # Print shape tuples without spaces and single quotes
             sshape = '(%s)' % (','.join(map(str, array.shape)),)
             table.append([array.name,
                 hcu.fmt_bytes(nbytes),
-                np.dtype(array.dtype).name,
+                reified.dtype.name,
                 sshape])
 
         return table, headers
@@ -702,17 +909,25 @@ class HyperCube(object):
         headers = ['Property Name', 'Type', 'Value', 'Default Value']
 
         table = []
-        for propval in sorted(iter(self._properties.values()),
+        for propval in sorted(self._properties.values(),
                               key=lambda pval: pval.name.upper()):
             table.append([propval.name,
                 np.dtype(propval.dtype).name,
-                getattr(self, propval.name),
+                self._property_values[propval.name],
                 propval.default])
 
         return table, headers
 
-    def __str__(self):
-        """ Outputs a string representation of this object """
+    def _dims_and_arrays_str(self):
+        """
+        Dimension and array sections of __str__,
+        cached until dimensions or arrays change
+        """
+        version = (self._dims_state(), self._array_version)
+        cached_version, text = self._str_cache
+
+        if cached_version == version:
+            return text
 
         result = []
 
@@ -727,6 +942,17 @@ class HyperCube(object):
             result.append("Registered Arrays:\n%s\n\n" % (
                 tabulate(table, headers=headers),))
 
+        text = ''.join(result)
+        self._str_cache = (version, text)
+        return text
+
+    def __str__(self):
+        """ Outputs a string representation of this object """
+
+        result = [self._dims_and_arrays_str()]
+
+        # Property values change without a version bump,
+        # so this section is always regenerated
         if len(self._properties) > 0:
             table, headers = self._gen_property_table()
             result.append("Registered Properties:\n%s\n\n" % (tabulate(
@@ -734,6 +960,103 @@ class HyperCube(object):
 
         return ''.join(result)
 
+    def choose_strides(self, *dim_strides, **kwargs):
+        """
+        Chooses chunk strides for the supplied dimensions, such that
+        the chunks of the given arrays fit within a memory budget
+        (an L2 cache by default), while maximising the ratio of
+        chunk volume to chunk surface.
+
+        Dimensions may be supplied as names, or as (dimension, stride)
+        tuples. A stride of 'auto' is chosen from powers of two and the
+        dimension's global size, while any other stride is kept as is.
+
+        .. code-block:: python
+
+            strides = cube.choose_strides('ntime', 'nbl', ('nchan', 64))
+
+            for d in cube.dim_iter(*strides):
+                cube.update_dimensions(d)
+
+        Parameters
+        ----------
+        *dim_strides : list
+            list of dimension names or (dimension, stride) tuples
+        arrays : list, optional
+            names of the arrays whose chunks must fit within budget.
+            Defaults to all registered arrays.
+        budget : int, optional
+            chunk memory budget in bytes. Defaults to 2MB.
+
+        Returns
+        -------
+        list
+            list of (dimension, stride) tuples, suitable for
+            :meth:`dim_iter` and friends
+        """
+        arrays = kwargs.get('arrays', None)
+        budget = kwargs.get('budget', 2 << 20)
+
+        if arrays is None:
+            arrays = list(self._arrays.keys())
+
+        dim_strides = [(ds, 'auto') if type(ds) is str else tuple(ds)
+            for ds in dim_strides]
+        index = { d: i for i, (d, _) in enumerate(dim_strides) }
+
+        # For each array, the bytes in a chunk excluding the strided
+        # dimensions, and the positions of the strided dimensions it spans
+        footprints = []
+
+        for n in arrays:
+            view = self._reified_array_view(n)
+            nbytes = view.dtype.itemsize
+            spans = []
+
+            for d, size in zip(self._arrays[n].shape, view.shape):
+                if d in index:
+                    spans.append(index[d])
+                else:
+                    nbytes *= size
+
+            footprints.append((nbytes, spans))
+
+        def _candidates(d, stride):
+            if not isinstance(stride, str):
+                return [stride]
+
+            size = self._dims[d].global_size
+            candidates, s = {size}, 1
+
+            while s < size:
+                candidates.add(s)
+                s <<= 1
+
+            return sorted(candidates)
+
+        best, best_score = None, None
+
+        for strides in itertools.product(*(_candidates(d, s)
+                for d, s in dim_strides)):
+            nbytes = sum(b*hcu.prod(strides[i] for i in spans)
+                for b, spans in footprints)
+
+            if nbytes > budget:
+                continue
+
+            volume = hcu.prod(strides)
+            score = (volume / max(sum(strides), 1), volume)
+
+            if best_score is None or score > best_score:
+                best, best_score = strides, score
+
+        # Nothing fits, fall back to the smallest chunks
+        if best is None:
+            best = tuple(c[0] for c in (_candidates(d, s)
+                for d, s in dim_strides))
+
+        return [(d, s) for (d, _), s in zip(dim_strides, best)]
+
     def endpoint_iter(self, *dim_strides, **kwargs):
         """
         Recursively iterate over the (dimension, stride)
@@ -746,14 +1069,16 @@ class HyperCube(object):
 
         .. code-block:: python
 
-            for (ts, te), (cs, ce) in cube.endpoint_iter(('ntime', 10), ('nchan', 4))
-                print 'Time range [{ts},{te}] Channel Range [{cs},{ce}]'.format(
-                    ts=ts, te=te, cs=cs, ce=ce)
+            for (ts, te), (cs, ce) in cube.endpoint_iter(('ntime', 10), ('nchan', 4)):
+                print('Time range [{ts},{te}] Channel Range [{cs},{ce}]'.format(
+                    ts=ts, te=te, cs=cs, ce=ce))
 
         Parameters
         ----------
         *dim_strides : list
-            list of (dimension, stride) tuples
+            list of (dimension, stride) tuples. Strides of 'auto'
+            are chosen by :meth:`choose_strides`, within
+            an optional budget keyword argument.
 
 
         Returns
@@ -764,17 +1089,39 @@ class HyperCube(object):
 
         """
 
+        return itertools.product(*self._chunk_endpoints(
+            dim_strides, **kwargs))
+
+    extent_iter = endpoint_iter
+
+    def _chunk_endpoints(self, dim_strides, **kwargs):
+        """
+        Returns a list of (lower, upper) extent tuples for each
+        (dimension, stride) tuple in dim_strides, resolving
+        any 'auto' strides with :meth:`choose_strides`
+        """
+
+        # Pair lower and upper extents with C-level range and
+        # zip iterators, rather than a per-chunk Python min()
         def _dim_endpoints(size, stride):
             size = int(size)
             stride = int(stride)
-            r = range(0, size, stride) if stride > 0 else range(0, size)
-            return ((i, min(i+stride, size)) for i in r)
 
-        dims = self.dimensions(copy=False)
-        gens = (_dim_endpoints(dims[d].global_size, s) for d, s in dim_strides)
-        return itertools.product(*gens)
+            if stride > 0:
+                lower = range(0, size, stride)
+                upper = itertools.chain(range(stride, size, stride), (size,))
+            else:
+                lower = range(0, size)
+                upper = range(stride, size + stride)
 
-    extent_iter = endpoint_iter
+            return zip(lower, upper)
+
+        if any(isinstance(s, str) for _, s in dim_strides):
+            budget = kwargs.get('budget', 2 << 20)
+            dim_strides = self.choose_strides(*dim_strides, budget=budget)
+
+        return [list(_dim_endpoints(self._dims[d].global_size, s))
+            for d, s in dim_strides]
 
     def slice_iter(self, *dim_strides, **kwargs):
         """
@@ -807,11 +1154,9 @@ class HyperCube(object):
             :code:`(slice(d0_low, d0_high, 1), slice(d1_low, d1_high,1))`
 
         """
-        def _create_slices(*args):
-            return tuple(slice(s,e,1) for (s, e) in args)
-
-        return (_create_slices(*s) for s in self.endpoint_iter(
-            *dim_strides, **kwargs))
+        # Build each dimension's slices once, rather than once per chunk
+        return itertools.product(*([slice(s,e,1) for (s, e) in endpoints]
+            for endpoints in self._chunk_endpoints(dim_strides, **kwargs)))
 
     def dim_iter(self, *dim_strides, **kwargs):
         """
@@ -842,17 +1187,15 @@ class HyperCube(object):
         """
 
         # Extract dimension names
-        dims = [ds[0] for ds in dim_strides]
+        dims = tuple(ds[0] for ds in dim_strides)
 
-        def _create_dim_dicts(*args):
-            return tuple({ 'name': d,
+        # Return a tuple-dict-creating generator over the
+        # flat product of endpoints produced by endpoint_iter
+        return (tuple({ 'name': d,
                     'lower_extent': s,
                     'upper_extent': e
-                } for (d, (s, e)) in args)
-
-        # Return a tuple-dict-creating generator
-        return (_create_dim_dicts(*list(zip(dims, s))) for s
-            in self.endpoint_iter(*dim_strides, **kwargs))
+                } for d, (s, e) in zip(dims, endpoints))
+            for endpoints in self.endpoint_iter(*dim_strides, **kwargs))
 
     def cube_iter(self, *dim_strides, **kwargs):
         """Recursively iterate over the (dimension, stride)
@@ -58,7 +58,9 @@ def create_dimension(name, dim_data, **kwargs):
     """
     if isinstance(dim_data, Dimension):
         dim = dim_data.copy()
-        dim.update(**kwargs)
+
+        if kwargs:
+            dim.update(**kwargs)
     else:
         dim = Dimension(name, dim_data, **kwargs)
 
@@ -69,7 +71,13 @@ class Dimension(object):
     The Dimension class describes a hypercube dimension.
     """
     __slots__ = ['_name', '_global_size',
-        '_lower_extent', '_upper_extent', '_description']
+        '_lower_extent', '_upper_extent', '_extent_size',
+        '_description', '_sort_key']
+
+    # Counts changes made by update() to any Dimension, so that
+    # caches of dimension state can detect changes made
+    # directly to Dimension objects
+    _mutations = 0
 
     def __init__(self, name, global_size,
             lower_extent=None, upper_extent=None,
@@ -90,10 +98,13 @@ class Dimension(object):
 
         """
         self._name = name
+        # Case-insensitive key for sorting dimensions by name
+        self._sort_key = name.upper()
         self._global_size = global_size
         self._lower_extent = 0 if lower_extent is None else lower_extent
         self._upper_extent = (global_size if upper_extent is None
                                     else upper_extent)
+        self._update_extent_size()
         self._description = (DEFAULT_DESCRIPTION if description is None
                                     else description)
 
@@ -103,10 +114,16 @@ class Dimension(object):
         -------
             A copy of the dimension
         """
-        return Dimension(self._name, self._global_size,
-            lower_extent=self._lower_extent,
-            upper_extent=self._upper_extent,
-            description=self._description)
+        # Copy slots directly, the values are already resolved
+        dim = Dimension.__new__(Dimension)
+        dim._name = self._name
+        dim._sort_key = self._sort_key
+        dim._global_size = self._global_size
+        dim._lower_extent = self._lower_extent
+        dim._upper_extent = self._upper_extent
+        dim._extent_size = self._extent_size
+        dim._description = self._description
+        return dim
 
     @property
     def name(self):
@@ -128,28 +145,60 @@ class Dimension(object):
         """ Upper dimension extent """
         return self._upper_extent
 
+    @property
+    def extents(self):
+        """ (lower_extent, upper_extent) tuple, built on demand """
+        return (self._lower_extent, self._upper_extent)
+
     @property
     def extent_size(self):
         """
         Size of the dimension extents.
         Equal to :obj:`~Dimension.upper_extent` - :obj:`~Dimension.lower_extent`
         """
-        return self.upper_extent - self.lower_extent
+        if self._extent_size is None:
+            return self._upper_extent - self._lower_extent
+
+        return self._extent_size
+
+    def _update_extent_size(self):
+        """ Caches the extent size, if the extents are numeric """
+        try:
+            self._extent_size = self._upper_extent - self._lower_extent
+        except TypeError:
+            self._extent_size = None
 
     @property
     def description(self):
         """ Dimension description """
         return self._description
 
-    def __eq__(self, other):
+    def __reduce__(self):
+        # Reconstruct from the constructor arguments,
+        # so that copy, deepcopy and pickle needn't walk the slots
+        return (Dimension, (self._name, self._global_size,
+            self._lower_extent, self._upper_extent, self._description))
+
+    def _key(self):
+        """ Tuple of the fields used for equality and hashing """
         # Note description is left out
-        return (self.name == other.name and
-            self.global_size == other.global_size and
-            self.lower_extent == other.lower_extent and
-            self.upper_extent == other.upper_extent)
+        return (self._name, self._global_size,
+            self._lower_extent, self._upper_extent)
+
+    def __eq__(self, other):
+        if not isinstance(other, Dimension):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __hash__(self):
+        # Dimensions are mutable, so don't
+        # update a Dimension used as a key
+        return hash(self._key())
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
 
     def update(self, global_size=None, lower_extent=None, upper_extent=None,
         description=None):
@@ -168,27 +217,44 @@ class Dimension(object):
             Dimension description (Default value = None)
         """
 
-        if global_size is not None: self._global_size = global_size
-        if lower_extent is not None: self._lower_extent = lower_extent
-        if upper_extent is not None: self._upper_extent = upper_extent
-        if description is not None: self._description = description
+        # Nothing affecting validity has changed
+        if global_size is None and lower_extent is None and upper_extent is None:
+            if description is not None:
+                self._description = description
+                Dimension._mutations += 1
+
+            return
+
+        gs = self._global_size if global_size is None else global_size
+        el = self._lower_extent if lower_extent is None else lower_extent
+        eu = self._upper_extent if upper_extent is None else upper_extent
 
         # Check that we've been given valid values
-        self.validate()
+        # before assigning any of them
+        self._validate(gs, el, eu)
+
+        if description is not None: self._description = description
+        self._global_size = gs
+        self._lower_extent = el
+        self._upper_extent = eu
+
+        if lower_extent is not None or upper_extent is not None:
+            self._update_extent_size()
+
+        Dimension._mutations += 1
 
     def validate(self):
         """ Validate the contents of a dimension data dictionary """
+        self._validate(self._global_size,
+            self._lower_extent, self._upper_extent)
 
-        extents_valid = (0 <= self.lower_extent <= self.upper_extent
-            <= self.global_size)
-
-        if not extents_valid:
-            raise ValueError("Dimension '{d}' fails 0 <= {el} <= {eu} <= {gs}"
-                .format(d=self.name, gs=self.global_size,
-                    el=self.lower_extent, eu=self.upper_extent))
+    def _validate(self, gs, el, eu):
+        """ Validate the supplied global size and extents """
+        if not 0 <= el <= eu <= gs:
+            raise ValueError(f"Dimension '{self._name}' fails "
+                f"0 <= {el} <= {eu} <= {gs}")
 
     def __str__(self):
-        return ("['{n}': global: {gs} lower: {el} upper: {eu}]").format(
-                n=self.name, gs=self.global_size,
-                el=self.lower_extent, eu=self.upper_extent)
+        return (f"['{self._name}': global: {self._global_size} "
+            f"lower: {self._lower_extent} upper: {self._upper_extent}]")
 
@@ -19,9 +19,6 @@
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
 
-
-import sys
-
 import numpy as np
 import hypercube as hc
 import hypercube.util as hcu
@@ -37,13 +34,17 @@ cube.register_dimension('facet_width', 128, description='Facet Width')
 cube.register_dimension('facet_height', 128, description='Facet Height')
 cube.register_dimension('npol', 4, description='Polarisations')
 
-# Register gridding arrays in terms of dimensions above
-cube.register_array('main_grid', ('grid_width', 'grid_height', 'nchan', 'npol'),
-    dtype=np.complex128)
-cube.register_array('facets', ('nfacet', 'facet_width', 'facet_height', 'nchan', 'npol'),
-    dtype=np.complex128)
-
-# Above produces a 50.5TB problem size,
+# Register gridding arrays in terms of dimensions above.
+# The image plane is innermost in both arrays.
+# In main_grid, channel leads, so that each channel,
+# and each polarisation within it, is contiguous
+cube.register_array('main_grid', ('nchan', 'npol', 'grid_width', 'grid_height'),
+    dtype=np.complex64)
+# In facets, polarisation leads, so that each polarisation is contiguous
+cube.register_array('facets', ('npol', 'nfacet', 'nchan', 'facet_width', 'facet_height'),
+    dtype=np.complex64)
+
+# Above produces a 101TB problem size,
 # need to reduce the local size of our problem
 print(cube)
 print('\n'*4)
@@ -52,17 +53,16 @@ print('REDUCING LOCAL PROBLEM SIZE\n',
     'grid_height => 256\n',
     'nchan => 128\n',
     '\n'
-    'Note: extents[1] - extents[0] <= local_size')
+    'Note: 0 <= lower_extent <= upper_extent <= global_size')
 print('\n'*3)
 
-# Set grid width extents to 1000 - 1256
-cube.update_dimension(name='grid_width', lower_extent=1000, upper_extent=1256)
-
-# Set grid height extents to 1000 - 1256
-cube.update_dimension(name='grid_height', lower_extent=1000, upper_extent=1256)
-
-# Set channel extents 600-700
-cube.update_dimension(name='nchan', lower_extent=600, upper_extent=700)
+# Set grid width and height extents to 1000 - 1256
+# and channel extents to 600 - 700
+cube.update_dimensions({
+    'grid_width': {'lower_extent': 1000, 'upper_extent': 1256},
+    'grid_height': {'lower_extent': 1000, 'upper_extent': 1256},
+    'nchan': {'lower_extent': 600, 'upper_extent': 700},
+})
 
 print (cube)
 
@@ -71,40 +71,67 @@ print (cube)
 np_cube = hc.HyperCube()
 
 # Register dimension and array information from the original hypercube
-np_cube.register_dimensions(iter(cube.dimensions().values()))
-np_cube.register_arrays(iter(cube.arrays().values()))
+np_cube.register_dimensions(cube.dimensions(copy=False))
+np_cube.register_arrays(cube.arrays())
 hc.create_local_numpy_arrays_on_cube(np_cube)
 
 # Get some dimension information to check our numpy shape size
-grid_width, grid_height, nchan, npol = np_cube.dim_extent_size(
-    'grid_width', 'grid_height', 'nchan', 'npol')
-assert np_cube.main_grid.shape == (grid_width, grid_height, nchan, npol)
+npol, nchan, grid_width, grid_height = np_cube.dim_extent_size(
+    'npol', 'nchan', 'grid_width', 'grid_height')
+assert np_cube.main_grid.shape == (nchan, npol, grid_width, grid_height)
 
-# Do some Numpy-like things on channel 1
-np_cube.main_grid[:,:,1] = 1 - 1*1j
+# Do some Numpy-like things on channel 1.
+# Arrays are created with np.empty, so only this channel is written,
+# as a single contiguous block
+np_cube.main_grid[1].fill(np.complex64(1 - 1*1j))
 
 print(hcu.fmt_bytes(np_cube.main_grid.nbytes))
 
-try:
-    import pycuda.autoinit
-
-    # Create a cuda hypercube, which will hold gpu arrays
-    # corresponding to local array sizes
-    cuda_cube = hc.HyperCube()
-
-    # Register dimension and array information from the original hypercube
-    cuda_cube.register_dimensions(iter(cube.dimensions().values()))
-    cuda_cube.register_arrays(iter(cube.arrays().values()))
-
-    # Reduce local number of facets to 1 and handle [0,1]
-    cuda_cube.update_dimension(name='nfacet',
-        local_size=1, lower_extent=0, upper_extent=1)
-
-    hc.create_local_pycuda_arrays_on_cube(cuda_cube)
-
-    print(cuda_cube)
-except:
-    raise ValueError("PyCUDA not installed or not "
-        "enough GPU memory to hold {b}"
-            .format(b=np_cube.mem_required())).with_traceback(sys.exc_info()[2])
+# Arrays live in the numpy hypercube's instance dictionary,
+# so dropping the cube releases the host buffers before
+# any gpu arrays are allocated, rather than holding both
+del np_cube
+
+def build_cuda_cube(cube):
+    """
+    Creates a cuda hypercube holding gpu arrays corresponding
+    to local array sizes. CUDA is only initialised here,
+    when gpu arrays are actually requested
+    """
+    import pycuda.driver as cuda
+
+    cuda.init()
+    context = cuda.Device(0).make_context()
+    arrays = {}
+
+    try:
+        cuda_cube = hc.HyperCube()
+
+        # Register dimension and array information from the original hypercube
+        cuda_cube.register_dimensions(cube.dimensions(copy=False))
+        cuda_cube.register_arrays(cube.arrays())
+
+        # Reduce local number of facets to 1 and handle [0,1]
+        cuda_cube.update_dimension(name='nfacet',
+            lower_extent=0, upper_extent=1)
+
+        try:
+            arrays = hc.create_local_pycuda_arrays_on_cube(cuda_cube)
+        except cuda.MemoryError as e:
+            raise ValueError("Not enough GPU memory to hold {b}"
+                .format(b=cuda_cube.mem_required())) from e
+
+        print(cuda_cube)
+    finally:
+        # Free device memory while its context is still current,
+        # then release the context itself
+        for ary in arrays.values():
+            ary.gpudata.free()
+
+        context.pop()
+        context.detach()
 
+try:
+    build_cuda_cube(cube)
+except ImportError as e:
+    raise ValueError("PyCUDA not installed") from e
@@ -65,13 +65,13 @@ for i, d in enumerate(cube.dim_iter(*iter_args)):
     print('reified visibilities shape', cube.array('visibilities', reify=True).shape)
 
     # Expanded version of cube.dim_extents
-    #print zip(iter_dims, cube.dim_lower_extent(*iter_dims))
-    #print zip(iter_dims, cube.dim_upper_extent(*iter_dims))
+    #print(list(zip(iter_dims, cube.dim_lower_extent(*iter_dims))))
+    #print(list(zip(iter_dims, cube.dim_upper_extent(*iter_dims))))
 
-    # These won't change during the loop, except local size
+    # These won't change during the loop, except extent size
     # at the end
-    #print zip(iter_dims, cube.dim_local_size(*iter_dims))
-    #print zip(iter_dims, cube.dim_global_size(*iter_dims))
+    #print(list(zip(iter_dims, cube.dim_extent_size(*iter_dims))))
+    #print(list(zip(iter_dims, cube.dim_global_size(*iter_dims))))
 
 
 print(cube)
@@ -48,7 +48,8 @@ def suite():
     niter = 1
 
     for n in range(niter):
-        test_suite.addTest(unittest.makeSuite(test_cube.Test))
+        test_suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(
+            test_cube.Test))
 
     return test_suite
 
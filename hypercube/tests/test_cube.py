@@ -18,6 +18,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
+import copy
+import itertools
+import pickle
 import unittest
 import sys
 
@@ -31,6 +34,17 @@ class Test(unittest.TestCase):
     """
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """ Register the dimensions common to several test cases once """
+        ntime, na, nchan, npol = 100, 64, 128, 4
+        nbl = na*(na-1)//2
+        nvis = ntime*nbl*nchan
+
+        cls.template_cube = cube = hc.HyperCube()
+        cube.register_dimensions({ 'ntime': ntime, 'na': na,
+            'nchan': nchan, 'npol': npol, 'nbl': nbl, 'nvis': nvis })
+
     def setUp(self):
         """ Set up each test case """
         pass
@@ -69,18 +83,39 @@ class Test(unittest.TestCase):
 
         dims = cube.dimensions()
 
-        self.assertTrue(dims['ntime'].global_size == ntime)
-        self.assertTrue(dims['ntime'].lower_extent == 1)
-        self.assertTrue(dims['ntime'].upper_extent == local_ntime)
+        # Compare (global_size, lower_extent, upper_extent) in one go
+        self.assertEqual({ n: (d.global_size, d.lower_extent, d.upper_extent)
+            for n, d in dims.items() }, {
+                'ntime': (ntime, 1, local_ntime),
+                'na': (na, 2, local_na),
+                'nchan': (nchan, 3, local_nchan),
+                'npol': (npol, 0, npol) })
+
+
+    def test_single_dimension_class(self):
+        """ Test that a single Dimension class is in use """
+        import hypercube.dims
 
-        self.assertTrue(dims['na'].global_size == na)
-        self.assertTrue(dims['na'].lower_extent == 2)
-        self.assertTrue(dims['na'].upper_extent == local_na)
+        dim = create_dimension('ntime', 10)
+        self.assertIs(hypercube.dims.Dimension, dim.__class__)
+        self.assertIs(hc.Dimension, dim.__class__)
+        self.assertIs(create_dimension('ntime', dim).__class__,
+            hypercube.dims.Dimension)
 
-        self.assertTrue(dims['nchan'].global_size == nchan)
-        self.assertTrue(dims['nchan'].lower_extent ==3)
-        self.assertTrue(dims['nchan'].upper_extent == local_nchan)
+    def test_dimension_copy_and_pickle(self):
+        """ Test Dimension copying and pickling """
+        dim = create_dimension('ntime', 10, lower_extent=2,
+            upper_extent=7, description='Timesteps')
 
+        for other in (copy.copy(dim), copy.deepcopy(dim),
+            pickle.loads(pickle.dumps(dim))):
+
+            self.assertIsInstance(other, hc.Dimension)
+            self.assertEqual(other, dim)
+            self.assertIsNot(other, dim)
+            self.assertEqual(other.description, 'Timesteps')
+            self.assertEqual(other.extent_size, 5)
+            self.assertEqual(other.extents, (2, 7))
 
     def test_dimension_updates(self):
         """ Test dimension updates """
@@ -94,11 +129,11 @@ class Test(unittest.TestCase):
         cube.register_dimension('nchan', nchan)
 
         tdim = cube.dimensions()['ntime']
-        self.assertTrue(tdim.global_size == tdim.extent_size)
+        self.assertEqual(tdim.global_size, tdim.extent_size)
 
         # Check that setting the global size greater than the extent size succeeds
         cube.update_dimension(name='ntime', global_size=120)
-        self.assertTrue(tdim.global_size == 120)
+        self.assertEqual(tdim.global_size, 120)
 
         # Check that setting the global size less than the extent size fails
         with self.assertRaises(ValueError) as cm:
@@ -109,6 +144,33 @@ class Test(unittest.TestCase):
         # This should succeed
         cube.update_dimension(name='ntime', global_size=80, upper_extent=80)
 
+        # Check that updates keyed on dimension name succeed
+        cube.update_dimensions({
+            'ntime': {'lower_extent': 10, 'upper_extent': 20},
+            'na': {'lower_extent': 1, 'upper_extent': 3},
+        })
+
+        self.assertEqual(cube.dim_extents('ntime', 'na'), [(10, 20), (1, 3)])
+
+        # Updates made directly to a registered Dimension are visible
+        cube.dimension('ntime', copy=False).update(upper_extent=15)
+        self.assertEqual(cube.dim_upper_extent('ntime'), 15)
+        self.assertEqual(cube.dim_extent_size('ntime'), 5)
+
+        # An update failing validation leaves the dimension unchanged
+        ntime_dim = cube.dimension('ntime')
+
+        with self.assertRaises(ValueError):
+            cube.update_dimension('ntime', global_size=12)
+
+        self.assertEqual(cube.dimension('ntime', copy=False), ntime_dim)
+        self.assertEqual(cube.dim_global_size('ntime'), ntime_dim.global_size)
+
+        # Copying dimensions doesn't count as a change
+        mutations = hc.Dimension._mutations
+        cube.copy()
+        self.assertEqual(hc.Dimension._mutations, mutations)
+
     def test_array_registration_and_reification(self):
         """ Test array registration and reification """
         # Set up our problem size
@@ -132,12 +194,12 @@ class Test(unittest.TestCase):
         # Test that we still have an abstract shape when
         # no reification is requested
         arrays = cube.arrays()
-        self.assertTrue(arrays[VIS].shape == abstract_shape)
+        self.assertEqual(arrays[VIS].shape, abstract_shape)
 
         # Test that we have a concrete shape after reifying the arrays
         arrays = cube.arrays(reify=True)
         concrete_shape = (ntime, nbl, nchan, npol)
-        self.assertTrue(arrays[VIS].shape == concrete_shape)
+        self.assertEqual(arrays[VIS].shape, concrete_shape)
 
         # Update the local size and extents of the time dimension
         local_ntime = ntime//2
@@ -148,34 +210,83 @@ class Test(unittest.TestCase):
         # after reifying the arrays
         arrays = cube.arrays(reify=True)
         concrete_shape = (local_ntime, nbl, nchan, npol)
-        self.assertTrue(arrays[VIS].shape == concrete_shape)
+        self.assertEqual(arrays[VIS].shape, concrete_shape)
+
+        # Test that direct Dimension updates are reflected
+        cube.dimension('ntime', copy=False).update(upper_extent=ntime)
+        self.assertEqual(cube.array(VIS, reify=True).shape,
+            (ntime, nbl, nchan, npol))
+        self.assertEqual(cube.bytes_required(), ntime*nbl*nchan*npol*16)
+        cube.dimension('ntime', copy=False).update(upper_extent=local_ntime)
+
+        # Test that array records can't be modified behind the cube's back
+        with self.assertRaises(AttributeError):
+            cube.array(VIS).shape = ('ntime', 'nbl', 'nchan')
+        self.assertEqual(cube.array(VIS, reify=True).shape, concrete_shape)
+        self.assertEqual(cube.bytes_required(),
+            local_ntime*nbl*nchan*npol*16)
 
         # Test individual array retrieval
         array = cube.array(VIS)
-        self.assertTrue(array.shape == abstract_shape)
+        self.assertEqual(array.shape, abstract_shape)
 
         # Test individual array reification
         array = cube.array(VIS, reify=True)
-        self.assertTrue(array.shape == concrete_shape)
+        self.assertEqual(array.shape, concrete_shape)
 
         # Test that we still have an abstract shape when
         # no reification is requested
         arrays = cube.arrays()
-        self.assertTrue(arrays[VIS].shape == abstract_shape)
+        self.assertEqual(arrays[VIS].shape, abstract_shape)
+
+    def test_array_records(self):
+        """ Test array record attribute and mapping access """
+        cube = hc.HyperCube()
+        cube.register_dimension('ntime', 10)
+        cube.register_array('uvw', ('ntime', 3), np.float64, page_locked=True)
+
+        uvw = cube.array('uvw')
+        self.assertIsInstance(uvw, hc.ArrayRecord)
+
+        # Fields are available as attributes and mapping keys
+        self.assertEqual(uvw.shape, ('ntime', 3))
+        self.assertEqual(uvw['shape'], ('ntime', 3))
+        self.assertIs(uvw.page_locked, True)
+        self.assertIs(uvw['page_locked'], True)
+        self.assertEqual(dict(uvw), { 'name': 'uvw', 'dtype': np.float64,
+            'shape': ('ntime', 3), 'page_locked': True })
+
+        with self.assertRaises(AttributeError):
+            uvw.missing
+
+        # Records can be used to register arrays on other cubes
+        other = hc.HyperCube()
+        other.register_arrays(cube.arrays())
+        self.assertEqual(other.arrays(), cube.arrays())
+
+        # Copies don't modify the original record
+        reified = uvw.copy(shape=(10, 3))
+        self.assertEqual(reified.shape, (10, 3))
+        self.assertEqual(reified.page_locked, True)
+        self.assertEqual(uvw.shape, ('ntime', 3))
+
+        # Records survive copying and pickling
+        self.assertEqual(copy.deepcopy(uvw), uvw)
+        self.assertEqual(pickle.loads(pickle.dumps(uvw)), uvw)
+
+        # Reifying in place replaces the records
+        arrays = dict(cube.arrays())
+        hc.util.reify_arrays(arrays, cube.dimensions(), copy=False)
+        self.assertEqual(arrays['uvw'].shape, (10, 3))
+        self.assertEqual(uvw.shape, ('ntime', 3))
 
     def test_array_creation(self):
         ntime, na, nchan, npol = 100, 64, 128, 4
         nbl = na*(na-1)//2
         nvis = ntime*nbl*nchan
 
-        # Set up the hypercube dimensions
-        cube = hc.HyperCube()
-        cube.register_dimension('ntime', ntime)
-        cube.register_dimension('na', na)
-        cube.register_dimension('nchan', nchan)
-        cube.register_dimension('npol', npol)
-        cube.register_dimension('nbl', nbl)
-        cube.register_dimension('nvis', nvis)
+        # Copy the hypercube dimensions from the template
+        cube = self.template_cube.copy()
 
         # Register the array with abstract shapes
         cube.register_array('visibilities', ('ntime','nbl','nchan','npol'), np.complex128)
@@ -190,14 +301,14 @@ class Test(unittest.TestCase):
             self.assertTrue(isinstance(a, np.ndarray))
 
         # Check that the shape is correct
-        self.assertTrue(arrays['visibilities'].shape == (ntime, nbl, nchan, 4))
-        self.assertTrue(arrays['uvw'].shape == (ntime, nbl, 3))
-        self.assertTrue(arrays['ant_pairs'].shape == (2, ntime, nbl))
+        self.assertEqual(arrays['visibilities'].shape, (ntime, nbl, nchan, 4))
+        self.assertEqual(arrays['uvw'].shape, (ntime, nbl, 3))
+        self.assertEqual(arrays['ant_pairs'].shape, (2, ntime, nbl))
 
         # Check that the type is correct
-        self.assertTrue(arrays['visibilities'].dtype == np.complex128)
-        self.assertTrue(arrays['uvw'].dtype == np.float64)
-        self.assertTrue(arrays['ant_pairs'].dtype == np.int64)
+        self.assertEqual(arrays['visibilities'].dtype, np.complex128)
+        self.assertEqual(arrays['uvw'].dtype, np.float64)
+        self.assertEqual(arrays['ant_pairs'].dtype, np.int64)
 
         # Create the arrays
         arrays = hc.create_local_numpy_arrays_on_cube(cube)
@@ -207,14 +318,34 @@ class Test(unittest.TestCase):
             self.assertTrue(isinstance(a, np.ndarray))
 
         # Check that the shape is correct
-        self.assertTrue(cube.visibilities.shape == (ntime, nbl, nchan, 4))
-        self.assertTrue(cube.uvw.shape == (ntime, nbl, 3))
-        self.assertTrue(cube.ant_pairs.shape == (2, ntime, nbl))
+        self.assertEqual(cube.visibilities.shape, (ntime, nbl, nchan, 4))
+        self.assertEqual(cube.uvw.shape, (ntime, nbl, 3))
+        self.assertEqual(cube.ant_pairs.shape, (2, ntime, nbl))
 
         # Check that the type is correct
-        self.assertTrue(cube.visibilities.dtype == np.complex128)
-        self.assertTrue(cube.uvw.dtype == np.float64)
-        self.assertTrue(cube.ant_pairs.dtype == np.int64)
+        self.assertEqual(cube.visibilities.dtype, np.complex128)
+        self.assertEqual(cube.uvw.dtype, np.float64)
+        self.assertEqual(cube.ant_pairs.dtype, np.int64)
+
+        # Create cache line aligned arrays
+        arrays = hc.create_local_aligned_numpy_arrays_on_cube(cube)
+
+        for n, a in arrays.items():
+            self.assertEqual(a.ctypes.data % 64, 0)
+            self.assertEqual(a.shape, cube.array(n, reify=True).shape)
+            self.assertEqual(a.dtype, cube.array(n).dtype)
+
+        # Create arrays from a single pooled buffer
+        arrays = hc.create_local_pooled_numpy_arrays_on_cube(cube)
+
+        for n, a in arrays.items():
+            self.assertEqual(a.ctypes.data % 64, 0)
+            self.assertEqual(a.shape, cube.array(n, reify=True).shape)
+            self.assertEqual(a.dtype, cube.array(n).dtype)
+
+        # Arrays don't overlap within the buffer
+        for a, b in itertools.combinations(arrays.values(), 2):
+            self.assertFalse(np.may_share_memory(a, b))
 
     def test_dim_queries(self):
         # Set up our problem size
@@ -239,11 +370,11 @@ class Test(unittest.TestCase):
         # Test that the mutiple argument form works
         _ntime, _na, _nbl, _nchan, _nvis = cube.dim_global_size(*args)
 
-        self.assertTrue(_ntime == ntime)
-        self.assertTrue(_nbl == nbl)
-        self.assertTrue(_na == na)
-        self.assertTrue(_nchan == nchan)
-        self.assertTrue(_nvis == nvis)
+        self.assertEqual(_ntime, ntime)
+        self.assertEqual(_nbl, nbl)
+        self.assertEqual(_na, na)
+        self.assertEqual(_nchan, nchan)
+        self.assertEqual(_nvis, nvis)
 
         #========
         # Extents
@@ -253,22 +384,27 @@ class Test(unittest.TestCase):
         ((tl, tu), (al, au), (bl, bu),
             (cl, cu), (vl, vu)) = cube.dim_extents(*args)
 
-        self.assertTrue(tl == 1 and tu == ntime)
-        self.assertTrue(al == 2 and au == na)
-        self.assertTrue(cl == 3 and cu == nchan)
-        self.assertTrue(bl == 4 and bu == nbl)
-        self.assertTrue(vl == 5 and vu == nvis)
+        self.assertEqual((tl, tu), (1, ntime))
+        self.assertEqual((al, au), (2, na))
+        self.assertEqual((cl, cu), (3, nchan))
+        self.assertEqual((bl, bu), (4, nbl))
+        self.assertEqual((vl, vu), (5, nvis))
 
         # Test that integral argument for works
         (tl, tu), (ol, ou) = cube.dim_extents('ntime', 11)
 
-        self.assertTrue(tl == 1 and tu == ntime)
-        self.assertTrue(ol == 0 and ou == 11)
+        self.assertEqual((tl, tu), (1, ntime))
+        self.assertEqual((ol, ou), (0, 11))
 
         # Test that singleton argument form works
         tl, tu = cube.dim_extents('ntime')
 
-        self.assertTrue(tl == 1 and tu == ntime)
+        self.assertEqual((tl, tu), (1, ntime))
+
+        # Test that the dictionary form works
+        extents = cube.dim_extents_dict()
+
+        self.assertEqual(extents, dict(zip(args, cube.dim_extents(*args))))
 
         #============
         # Extent Size
@@ -277,24 +413,24 @@ class Test(unittest.TestCase):
         # Test that the mutiple argument form works
         _ntime, _na, _nbl, _nchan, _nvis = cube.dim_extent_size(*args)
 
-        self.assertTrue(_ntime == tu - tl)
-        self.assertTrue(_nbl == bu - bl)
-        self.assertTrue(_na == au - al)
-        self.assertTrue(_nchan == cu - cl)
-        self.assertTrue(_nvis == vu - vl)
+        self.assertEqual(_ntime, tu - tl)
+        self.assertEqual(_nbl, bu - bl)
+        self.assertEqual(_na, au - al)
+        self.assertEqual(_nchan, cu - cl)
+        self.assertEqual(_nvis, vu - vl)
 
         # Test that singleton argument form works
         _ntime = cube.dim_extent_size('ntime')
-        self.assertTrue(_ntime == tu - tl)
+        self.assertEqual(_ntime, tu - tl)
 
         # Test that the multiple arguments packed into a string form works
         _ntime, _na, _nbl, _nchan, _nvis = cube.dim_global_size(','.join(args))
 
-        self.assertTrue(_ntime == ntime)
-        self.assertTrue(_nbl == nbl)
-        self.assertTrue(_na == na)
-        self.assertTrue(_nchan == nchan)
-        self.assertTrue(_nvis == nvis)
+        self.assertEqual(_ntime, ntime)
+        self.assertEqual(_nbl, nbl)
+        self.assertEqual(_na, na)
+        self.assertEqual(_nchan, nchan)
+        self.assertEqual(_nvis, nvis)
 
         #============
         # Local Size
@@ -312,11 +448,11 @@ class Test(unittest.TestCase):
         # Test that the mutiple argument form works
         _ntime, _na, _nbl, _nchan, _nvis = cube.dim_extent_size(*args)
 
-        self.assertTrue(_ntime == local_ntime)
-        self.assertTrue(_nbl == local_nbl)
-        self.assertTrue(_na == local_na)
-        self.assertTrue(_nchan == local_nchan)
-        self.assertTrue(_nvis == local_nvis)
+        self.assertEqual(_ntime, local_ntime)
+        self.assertEqual(_nbl, local_nbl)
+        self.assertEqual(_na, local_na)
+        self.assertEqual(_nchan, local_nchan)
+        self.assertEqual(_nvis, local_nvis)
 
     def test_iterators(self):
         """ Test chunk iteration """
@@ -325,13 +461,8 @@ class Test(unittest.TestCase):
         nbl = na*(na-1)//2
         nvis = ntime*nbl*nchan
 
-        # Create a cube and register some dimensions
-        cube = hc.HyperCube()
-        cube.register_dimension('ntime', ntime)
-        cube.register_dimension('na', na)
-        cube.register_dimension('nchan', nchan)
-        cube.register_dimension('nbl', nbl)
-        cube.register_dimension('nvis', nvis)
+        # Copy a cube with these dimensions from the template
+        cube = self.template_cube.copy()
         cube.register_array('uvw', ('ntime', 'nbl', 3), np.float64)
 
         tsize, asize = 9, 5
@@ -342,27 +473,28 @@ class Test(unittest.TestCase):
 
         # Create array to iterate over
         A = np.arange(ntime*na).reshape(ntime, na)
-        A_sum = A.sum()
+        # Sum of 0 .. ntime*na - 1
+        A_sum = (ntime*na)*(ntime*na - 1)//2
 
         # Test that iterating over offsets works
         S = sum(A[ts:te,as_:ae].sum() for (ts, te), (as_, ae) in
             cube.endpoint_iter(('ntime', tsize), ('na', asize)))
-        self.assertTrue(S == A_sum)
+        self.assertEqual(S, A_sum)
 
         # Test that iterating over tuple indices works
         S = sum(A[i].sum() for i in
             cube.slice_iter(('ntime', tsize), ('na', asize)))
-        self.assertTrue(S == A_sum)
+        self.assertEqual(S, A_sum)
 
         # Test that iterating over destructured tuple indices works
         S = sum(A[t,a].sum() for t, a in
             cube.slice_iter(('ntime', tsize), ('na', asize)))
-        self.assertTrue(S == A_sum)
+        self.assertEqual(S, A_sum)
 
         # Test that iterating over hypercubes works
         S = sum(A[c.slice_index('ntime', 'na')].sum() for c in
             cube.cube_iter(('ntime', tsize), ('na', asize)))
-        self.assertTrue(S == A_sum)
+        self.assertEqual(S, A_sum)
 
         # Test that arrays aren't copied over by default
         for c in cube.cube_iter(('ntime', tsize), ('na', asize)):
@@ -381,24 +513,50 @@ class Test(unittest.TestCase):
             cube.update_dimensions(d)
             S += A[cube.slice_index('ntime', 'na')].sum()
 
-        self.assertTrue(S == A_sum)
+        self.assertEqual(S, A_sum)
+
+        #==========================
+        # Automatic Stride Tests
+        #==========================
+
+        cube.register_array('vis', ('ntime', 'nchan'), np.complex128)
+
+        # Whole dimensions fit within a large enough budget
+        strides = cube.choose_strides('ntime', 'nchan',
+            arrays=['vis'], budget=16*ntime*nchan)
+        self.assertEqual(strides, [('ntime', ntime), ('nchan', nchan)])
+
+        # Otherwise square chunks have the least surface
+        strides = cube.choose_strides('ntime', 'nchan',
+            arrays=['vis'], budget=16*32*32)
+        self.assertEqual(strides, [('ntime', 32), ('nchan', 32)])
+
+        # Fixed strides are kept
+        strides = cube.choose_strides('ntime', ('nchan', 64),
+            arrays=['vis'], budget=16*32*64)
+        self.assertEqual(strides, [('ntime', 32), ('nchan', 64)])
+
+        # Test that automatic strides cover the whole space
+        S = sum(A[i].sum() for i in cube.slice_iter(
+            ('ntime', 'auto'), ('na', 'auto'), budget=4096))
+        self.assertEqual(S, A_sum)
 
     def test_properties(self):
         cube = hc.HyperCube()
         cube.register_property('alpha', np.float64, 1.5)
 
-        self.assertTrue(cube.alpha == 1.5)
-        self.assertTrue(cube.alpha.dtype == np.float64)
+        self.assertEqual(cube.alpha, 1.5)
+        self.assertEqual(cube.alpha.dtype, np.float64)
 
         cube.set_alpha(1.6)
 
-        self.assertTrue(cube.alpha == 1.6)
-        self.assertTrue(cube.alpha.dtype == np.float64)
+        self.assertEqual(cube.alpha, 1.6)
+        self.assertEqual(cube.alpha.dtype, np.float64)
 
         cube.alpha = 1.7
 
-        self.assertTrue(cube.alpha == 1.7)
-        self.assertTrue(cube.alpha.dtype == np.float64)
+        self.assertEqual(cube.alpha, 1.7)
+        self.assertEqual(cube.alpha.dtype, np.float64)
 
     def test_mass_registration(self):
         # Dimensions
@@ -445,9 +603,42 @@ class Test(unittest.TestCase):
         lcube.register_properties(iter(P.values()))
 
         # The two should agree
-        self.assertTrue(dcube.dimensions() == lcube.dimensions())
-        self.assertTrue(dcube.arrays() == lcube.arrays())
-        self.assertTrue(dcube.properties() == lcube.properties())
+        self.assertEqual(dcube.dimensions(), lcube.dimensions())
+        self.assertEqual(dcube.arrays(), lcube.arrays())
+        self.assertEqual(dcube.properties(), lcube.properties())
+
+        # A batch containing a registered array registers nothing
+        with self.assertRaises(ValueError):
+            lcube.register_arrays([
+                { 'name': 'lm', 'shape': (2, 'nsrc'), 'dtype': np.float64 },
+                A['uvw']])
+
+        self.assertTrue('lm' not in lcube.arrays())
+
+        # Test registration by name keyed sizes and dictionaries
+        ncube = hc.HyperCube()
+        ncube.register_dimensions({ 'ntime': 72, 'na': 7,
+            'nbl': { 'global_size': 21, 'description': 'Baselines' } })
+
+        self.assertEqual(ncube.dimensions(), dcube.dimensions())
+        self.assertEqual(ncube.dimension('nbl').description, 'Baselines')
+
+        # A batch containing a registered dimension registers nothing
+        with self.assertRaises(AttributeError):
+            ncube.register_dimensions({ 'nchan': 16, 'na': 7 })
+
+        self.assertTrue('nchan' not in ncube.dimensions())
+
+        # Dimension dictionaries must specify a global size
+        with self.assertRaises(ValueError):
+            ncube.register_dimensions({ 'nchan': { 'lower_extent': 1 } })
+
+        # Registries are returned as read-only views
+        with self.assertRaises(TypeError):
+            lcube.arrays()['lm'] = A['uvw']
+
+        with self.assertRaises(TypeError):
+            lcube.dimensions(copy=False)['nchan'] = D['na']
 
     def test_array_extents_and_slice_index(self):
         ntime, nbl, nchan = 10, 21, 16
@@ -462,17 +653,17 @@ class Test(unittest.TestCase):
 
         vis_extents = cube.array_extents('model_vis')
 
-        self.assertTrue(vis_extents == [
+        self.assertEqual(vis_extents, [
             (1, ntime), (4, nbl), (3, nchan), (0, 4)])
 
         vis_slice = cube.array_slice_index('model_vis')
 
-        self.assertTrue(vis_slice == tuple((slice(1, ntime, 1),
+        self.assertEqual(vis_slice, tuple((slice(1, ntime, 1),
             slice(4, nbl, 1), slice(3, nchan, 1), slice(0, 4, 1))))
 
         vis_slice = cube.slice_index(*cube.array('model_vis').shape)
 
-        self.assertTrue(vis_slice == tuple((slice(1, ntime, 1),
+        self.assertEqual(vis_slice, tuple((slice(1, ntime, 1),
             slice(4, nbl, 1), slice(3, nchan, 1), slice(0, 4, 1))))
 
     def test_construct_and_copy(self):
@@ -514,15 +705,15 @@ class Test(unittest.TestCase):
         ecube.register_properties(P)
 
         copy = ecube.copy()
-        self.assertTrue(copy.dimensions() == ecube.dimensions())
-        self.assertTrue(copy.arrays() == ecube.arrays())
-        self.assertTrue(copy.properties() == ecube.properties())
+        self.assertEqual(copy.dimensions(), ecube.dimensions())
+        self.assertEqual(copy.arrays(), ecube.arrays())
+        self.assertEqual(copy.properties(), ecube.properties())
 
         # Register during construction
         ccube = hc.HyperCube(dimensions=D, arrays=A, properties=P)
-        self.assertTrue(ccube.dimensions() == ecube.dimensions())
-        self.assertTrue(ccube.arrays() == ecube.arrays())
-        self.assertTrue(ccube.properties() == ecube.properties())
+        self.assertEqual(ccube.dimensions(), ecube.dimensions())
+        self.assertEqual(ccube.arrays(), ecube.arrays())
+        self.assertEqual(ccube.properties(), ecube.properties())
 
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(Test)
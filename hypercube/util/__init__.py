@@ -18,14 +18,37 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
-import attridict as AttrDict
+import collections
+import functools
+import operator
+
 import numpy as np
 
+from hypercube.arrays import ArrayRecord
 from hypercube.dims import Dimension
 
+# attridict pulls in yaml on import, defer it to first use
+_AttrDict = None
+
+def attr_dict(*args, **kwargs):
+    """ Constructs an AttrDict, importing attridict on first use """
+    global _AttrDict
+
+    if _AttrDict is None:
+        import attridict as _AttrDict
+
+    return _AttrDict(*args, **kwargs)
+
+try:
+    from math import prod
+except ImportError:
+    def prod(iterable):
+        """ Product of the values in iterable, for Python < 3.8 """
+        return functools.reduce(operator.mul, iterable, 1)
+
 def array_bytes(array):
     """ Estimates the memory of the supplied array in bytes """
-    return np.product(array.shape)*np.dtype(array.dtype).itemsize
+    return int(prod(array.shape))*np.dtype(array.dtype).itemsize
 
 def fmt_bytes(nbytes):
     """ Returns a human readable string, given the number of bytes """
@@ -48,16 +71,45 @@ def setter_name(name):
     """ Constructs a name for the property, based on the property name """
     return 'set_' + name
 
+# Lightweight, read-only view of a reified array
+_ReifiedArrayView = collections.namedtuple('_ReifiedArrayView',
+    ['name', 'dtype', 'shape'])
+
 def reify_arrays(arrays, dims, copy=True):
     """
     Reify arrays, given the supplied dimensions. If copy is True,
     returns a copy of arrays else performs this inplace.
+    If copy is 'shallow', returns read-only views holding
+    only the name, numpy dtype and reified shape of each array.
     """
-    arrays = ({ k : AttrDict(**a) for k, a in arrays.items() }
-        if copy else arrays)
 
-    for n, a in arrays.items():
-        a.shape = tuple(dims[v].extent_size if isinstance(v, str) else v
-            for v in a.shape)
+    # Resolve each referenced dimension's extent size once,
+    # rather than once per array dimension
+    extent_sizes = {}
+
+    def _extent_size(v):
+        try:
+            return extent_sizes[v]
+        except KeyError:
+            size = extent_sizes[v] = dims[v].extent_size
+            return size
+
+    def _reify_shape(shape):
+        return tuple(_extent_size(v) if isinstance(v, str) else v
+            for v in shape)
+
+    if copy == 'shallow':
+        return { k: _ReifiedArrayView(a.name, np.dtype(a.dtype),
+                _reify_shape(a.shape))
+            for k, a in arrays.items() }
+
+    # Records are read-only, so create reified records,
+    # replacing those in arrays if not copying
+    reified = { k: a.copy(shape=_reify_shape(a.shape))
+        for k, a in arrays.items() }
+
+    if copy:
+        return reified
 
+    arrays.update(reified)
     return arrays
\ No newline at end of file
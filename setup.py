@@ -52,5 +52,5 @@ setup(name='hypercube',
         'six >= 1.10.0',
         'tabulate >= 0.7.5',
     ],
-    python_requires='>=3.0',
+    python_requires='>=3.6',
     zip_safe=True)